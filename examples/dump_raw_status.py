@@ -98,30 +98,30 @@ async def main(address: str):
             print("ERROR: Required characteristics not found")
             return
 
-        # Set up notification handler
-        status_data = None
-        event = asyncio.Event()
-
-        def handler(sender, data):
-            nonlocal status_data
-            if bytes(data[:2]) == MAGIC and data[2] == 0x01:
-                status_data = bytes(data)
-                event.set()
-
-        await client.start_notify(status_char, handler)
+        async def request(packet: bytes, packet_type: int) -> bytes | None:
+            """Send a request and return the first response of packet_type."""
+            fut = asyncio.get_running_loop().create_future()
+
+            def handler(sender, data):
+                if data[:2] == MAGIC and data[2] == packet_type and not fut.done():
+                    fut.set_result(bytes(data))
+
+            await client.start_notify(status_char, handler)
+            try:
+                await client.write_gatt_char(command_char, packet, response=True)
+                return await asyncio.wait_for(fut, timeout=10.0)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                await client.stop_notify(status_char)
 
         print("\n--- Sending Status Request ---")
         print(f"Request: {STATUS_REQUEST.hex()}")
 
-        await client.write_gatt_char(command_char, STATUS_REQUEST, response=True)
-
-        try:
-            await asyncio.wait_for(event.wait(), timeout=10.0)
-        except asyncio.TimeoutError:
+        status_data = await request(STATUS_REQUEST, 0x01)
+        if status_data is None:
             print("ERROR: No response received")
             return
-        finally:
-            await client.stop_notify(status_char)
 
         print(f"\n--- Raw Status Response ({len(status_data)} bytes) ---")
         print(hexdump(status_data))
@@ -142,25 +142,10 @@ async def main(address: str):
         history_request = bytes.fromhex("a5b6100605070000000014")
         print(f"Request: {history_request.hex()}")
 
-        history_data = None
-        event.clear()
-
-        def history_handler(sender, data):
-            nonlocal history_data
-            if bytes(data[:2]) == MAGIC and data[2] == 0x03:
-                history_data = bytes(data)
-                event.set()
-
-        await client.start_notify(status_char, history_handler)
-        await client.write_gatt_char(command_char, history_request, response=True)
-
-        try:
-            await asyncio.wait_for(event.wait(), timeout=10.0)
-        except asyncio.TimeoutError:
+        history_data = await request(history_request, 0x03)
+        if history_data is None:
             print("ERROR: No history response received")
             return
-        finally:
-            await client.stop_notify(status_char)
 
         print(f"\n--- Raw History Response ({len(history_data)} bytes) ---")
         print(hexdump(history_data))
@@ -135,69 +135,69 @@ async def main():
         visionair = VisionAirClient(client)
         visionair._find_characteristics()
 
-        # Collect all responses from a single notification subscription
+        # Collect all responses from a single notification subscription.
+        # A queue keeps every packet, including ones that arrive between
+        # requests, so none are lost to a cleared event.
         responses = {}
-        event = asyncio.Event()
-        expected_types = set()
+        queue: asyncio.Queue[tuple[str, bytes]] = asyncio.Queue()
 
-        def handler(data):
-            raw = bytes(data)
-            if len(raw) >= 3 and raw[:2] == MAGIC:
-                ptype = raw[2]
+        def handler(*args):
+            data = args[-1]
+            if len(data) >= 3 and data[:2] == MAGIC:
+                ptype = data[2]
                 type_name = {
                     0x01: "DEVICE_STATE",
                     0x02: "SCHEDULE",
                     0x03: "PROBE_SENSORS",
                 }.get(ptype, f"UNKNOWN_0x{ptype:02x}")
+                queue.put_nowait((type_name, bytes(data)))
+
+        async def collect(expected: set[str], timeout: float = 10) -> set[str]:
+            """Drain notifications until all expected types arrive; return the missing ones."""
+            missing = set(expected)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while missing:
+                try:
+                    type_name, raw = await asyncio.wait_for(
+                        queue.get(), timeout=deadline - loop.time()
+                    )
+                except asyncio.TimeoutError:
+                    break
                 responses[type_name] = raw
                 print(f"  Received {type_name} ({len(raw)} bytes)")
-                if type_name in expected_types:
-                    expected_types.discard(type_name)
-                    if not expected_types:
-                        event.set()
+                missing.discard(type_name)
+            return missing
 
         await client.start_notify(visionair._status_char, handler)
 
         # === Request 1: DEVICE_STATE_Q (0x03) ===
         print("\n--- Request 1: DEVICE_STATE_Q ---")
-        event.clear()
-        expected_types = {"DEVICE_STATE"}
         req = build_request(RequestParam.DEVICE_STATE)
         print(f"  Sending: {req.hex()}")
         await client.write_gatt_char(visionair._command_char, req, response=True)
-        try:
-            await asyncio.wait_for(event.wait(), timeout=10)
-        except asyncio.TimeoutError:
+        if await collect({"DEVICE_STATE"}):
             print("  TIMEOUT waiting for DEVICE_STATE")
 
         await asyncio.sleep(1)
 
         # === Request 2: FULL_DATA_Q (0x06) ===
         print("\n--- Request 2: FULL_DATA_Q ---")
-        event.clear()
-        expected_types = {"DEVICE_STATE", "SCHEDULE", "PROBE_SENSORS"}
         req = build_request(RequestParam.FULL_DATA, extended=True)
         print(f"  Sending: {req.hex()}")
         await client.write_gatt_char(visionair._command_char, req, response=True)
-        try:
-            await asyncio.wait_for(event.wait(), timeout=10)
-        except asyncio.TimeoutError:
-            missing = expected_types - set(responses.keys())
-            if missing:
-                print(f"  TIMEOUT (missing: {missing})")
+        missing = await collect({"DEVICE_STATE", "SCHEDULE", "PROBE_SENSORS"})
+        if missing:
+            print(f"  TIMEOUT (missing: {missing})")
 
         await asyncio.sleep(1)
 
         # === Request 3: PROBE_SENSORS_Q (0x07) ===
         print("\n--- Request 3: PROBE_SENSORS_Q ---")
-        event.clear()
-        expected_types = {"PROBE_SENSORS"}
         req = build_request(RequestParam.PROBE_SENSORS, extended=True)
         print(f"  Sending: {req.hex()}")
         await client.write_gatt_char(visionair._command_char, req, response=True)
-        try:
-            await asyncio.wait_for(event.wait(), timeout=10)
-        except asyncio.TimeoutError:
+        if await collect({"PROBE_SENSORS"}):
             print("  TIMEOUT waiting for PROBE_SENSORS")
 
         await client.stop_notify(visionair._status_char)
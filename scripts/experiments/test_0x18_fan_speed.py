@@ -112,20 +112,18 @@ def find_chars(client):
 async def send_and_capture(client, cc, sc, packet, ptype, timeout=10.0):
     """Send a BLE packet and wait for a specific response type."""
     result = None
-    event = asyncio.Event()
+    fut = asyncio.get_running_loop().create_future()
 
     def handler(*args):
-        nonlocal result
-        data = bytes(args[-1])
-        if len(data) >= 3 and bytes(data[:2]) == MAGIC and data[2] == ptype:
-            result = data
-            event.set()
+        data = args[-1]
+        if len(data) >= 3 and data[:2] == MAGIC and data[2] == ptype and not fut.done():
+            fut.set_result(bytes(data))
 
     await client.start_notify(sc, handler)
     try:
         await client.write_gatt_char(cc, packet, response=True)
         try:
-            await asyncio.wait_for(event.wait(), timeout=timeout)
+            result = await asyncio.wait_for(fut, timeout=timeout)
         except TimeoutError:
             print("    (timeout waiting for response)")
     finally:
@@ -64,20 +64,23 @@ def ts():
 
 async def send_and_read(client, cc, sc, packet):
     result = None
-    event = asyncio.Event()
+    fut = asyncio.get_running_loop().create_future()
 
     def handler(*args):
-        nonlocal result
-        data = bytes(args[-1])
-        if len(data) >= 3 and bytes(data[:2]) == b"\xa5\xb6" and data[2] == PacketType.DEVICE_STATE:
-            result = data
-            event.set()
+        data = args[-1]
+        if (
+            len(data) >= 3
+            and data[:2] == b"\xa5\xb6"
+            and data[2] == PacketType.DEVICE_STATE
+            and not fut.done()
+        ):
+            fut.set_result(bytes(data))
 
     await client.start_notify(sc, handler)
     try:
         await client.write_gatt_char(cc, packet, response=True)
         try:
-            await asyncio.wait_for(event.wait(), timeout=10.0)
+            result = await asyncio.wait_for(fut, timeout=10.0)
         except TimeoutError:
             pass
     finally:
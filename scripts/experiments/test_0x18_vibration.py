@@ -53,7 +53,7 @@ sys.path.insert(0, str(REPO_DIR))
 from visionair_ble.connect import connect_via_proxy
 from visionair_ble.client import VisionAirClient
 from visionair_ble.protocol import build_schedule_toggle, MAGIC, PacketType
-from scripts.sound_monitor import read_vibration
+from scripts.sound_monitor import SoundMonitorClient
 
 
 MAC = PROXY_HOST = API_KEY = None
@@ -93,12 +93,15 @@ def quick_connect():
 async def vibration_reading(label: str, n_samples: int = 3) -> float:
     """Take multiple vibration readings and return the average."""
     readings = []
-    for i in range(n_samples):
-        v = await read_vibration()
-        readings.append(v)
-        print(f"  [{ts()}] {label} sample {i+1}/{n_samples}: {v:.4f} m/s²")
-        if i < n_samples - 1:
-            await asyncio.sleep(2)
+    async with SoundMonitorClient() as monitor:
+        for i in range(n_samples):
+            v = (await monitor.read_once()).vibration
+            if v is None:
+                raise RuntimeError("No vibration reading received")
+            readings.append(v)
+            print(f"  [{ts()}] {label} sample {i+1}/{n_samples}: {v:.4f} m/s²")
+            if i < n_samples - 1:
+                await asyncio.sleep(2)
     avg = sum(readings) / len(readings)
     print(f"  [{ts()}] {label} average: {avg:.4f} m/s² (samples: {[f'{r:.4f}' for r in readings]})")
     return avg
@@ -4,6 +4,10 @@
 Monitors HA power sensors to detect physical fan speed changes without
 needing a human listener.
 
+Commands within a phase share one BLE connection and notification
+subscription. The connection is closed before each power monitoring
+window, so the VMI is measured without an active BLE link.
+
 Experiment design:
   1. Baseline: monitor power for 2 minutes (fan at LOW, set by remote)
   2. Phase A: send ONLY 0x18=HIGH (no init) — this should NOT change power
@@ -21,9 +25,13 @@ import json
 import os
 import subprocess
 import sys
-import time
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing and dumping
+    orjson = None
+
 # Fix output buffering
 print = functools.partial(print, flush=True)
 
@@ -56,7 +64,8 @@ def read_power():
     import urllib.request
     try:
         with urllib.request.urlopen(SHELLY_URL, timeout=5) as resp:
-            data = json.loads(resp.read())
+            body = resp.read()
+        data = orjson.loads(body) if orjson else json.loads(body)
         emeters = data.get("emeters", [])
         return {
             "main": emeters[0]["power"] if len(emeters) > 0 else None,
@@ -66,47 +75,53 @@ def read_power():
         return {"main": None, "heatpump": None}
 
 
+# SYNC payload: type, 06 06, summer limit temp (26°C), constant 02, then
+# day/hour/minute/second filled in per packet (bytes 5-8).
+_TIME_SYNC_TEMPLATE = bytes([PacketType.SYNC, 0x06, 0x06, 0x1A, 0x02, 0, 0, 0, 0])
+
+# REQUEST param 0x29 payload; the value goes in the last byte.
+_0X29_TEMPLATE = bytes([PacketType.REQUEST, 0x06, 0x05, 0x29, 0x00, 0x00, 0x00, 0x00])
+
+
 def build_time_sync():
     """Build a SYNC packet with current time (mimicking phone behavior)."""
     now = datetime.now()
-    payload = bytes([
-        PacketType.SYNC,
-        0x06,
-        0x06,
-        0x1A,       # summer limit temp (26°C) — constant config
-        0x02,       # constant
-        now.day,    # day (phone sends day-of-month or day-of-week)
-        now.hour,   # hour
-        now.minute, # minute
-        now.second, # second
-    ])
-    checksum = calc_checksum(payload)
-    return MAGIC + payload + bytes([checksum])
+    payload = bytearray(_TIME_SYNC_TEMPLATE)
+    payload[5] = now.day  # day (phone sends day-of-month or day-of-week)
+    payload[6] = now.hour
+    payload[7] = now.minute
+    payload[8] = now.second
+    payload.append(calc_checksum(payload))
+    return MAGIC + payload
 
 
 def build_0x29_request(value: int) -> bytes:
     """Build a REQUEST with param 0x29."""
-    payload = bytes([
-        PacketType.REQUEST,
-        0x06,
-        0x05,
-        0x29,
-        0x00,
-        0x00,
-        0x00,
-        value & 0xFF,
-    ])
-    checksum = calc_checksum(payload)
-    return MAGIC + payload + bytes([checksum])
+    payload = bytearray(_0X29_TEMPLATE)
+    payload[7] = value & 0xFF
+    payload.append(calc_checksum(payload))
+    return MAGIC + payload
+
+
+def dump_json(path, obj):
+    """Write obj as indented JSON, with orjson when available."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
 
 
 async def monitor_power(duration_s: int, label: str, interval: float = 2.0):
     """Monitor power sensors for a duration, return list of readings."""
     readings = []
-    start = time.time()
-    while time.time() - start < duration_s:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadline = start + duration_s
+    while (now := loop.time()) < deadline:
         power = read_power()
-        elapsed = time.time() - start
+        elapsed = now - start
         readings.append({"t": elapsed, **power})
         main = power.get("main", "?")
         hp = power.get("heatpump", "?")
@@ -115,18 +130,53 @@ async def monitor_power(duration_s: int, label: str, interval: float = 2.0):
     return readings
 
 
-async def send_and_read(client, cc, sc, command):
-    """Send a command and read the response notification."""
-    response = None
-    def handler(_, data):
-        nonlocal response
-        response = bytes(data)
-
-    await client.start_notify(sc, handler)
-    await client.write_gatt_char(cc, command, response=True)
-    await asyncio.sleep(1.0)
-    await client.stop_notify(sc)
-    return response
+class StatusStream:
+    """One notification subscription for the commands of an experiment phase.
+
+    Subscribes once on entry and unsubscribes on exit, so commands sent
+    during the phase don't each pay for CCCD writes. Every notification is
+    logged with its time relative to ``start`` (loop time).
+    """
+
+    def __init__(self, client, cc, sc):
+        self.client = client
+        self.cc = cc
+        self.sc = sc
+        self.start = 0.0
+        self.notifications: list[dict] = []
+        self._loop = asyncio.get_running_loop()
+        self._status_waiter: asyncio.Future | None = None
+
+    async def __aenter__(self):
+        self.start = self._loop.time()
+        await self.client.start_notify(self.sc, self._handler)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.stop_notify(self.sc)
+
+    def _handler(self, _, data):
+        data = bytes(data)
+        self.notifications.append({
+            "t": self._loop.time() - self.start,
+            "type": data[2] if len(data) >= 3 else None,
+            "hex": data.hex(),
+        })
+        if len(data) >= 3 and data[:2] == MAGIC and data[2] == PacketType.DEVICE_STATE:
+            waiter = self._status_waiter
+            if waiter is not None and not waiter.done():
+                waiter.set_result(data)
+
+    async def send(self, command, timeout: float = 1.0):
+        """Send a command and return the DEVICE_STATE notification it triggers."""
+        self._status_waiter = self._loop.create_future()
+        await self.client.write_gatt_char(self.cc, command, response=True)
+        try:
+            return await asyncio.wait_for(self._status_waiter, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._status_waiter = None
 
 
 async def main():
@@ -152,6 +202,7 @@ async def main():
         return sc, cc
 
     all_results = {}
+    notifications = {}
 
     # --- BASELINE ---
     print(f"\n{'='*60}")
@@ -165,12 +216,15 @@ async def main():
     print(f"{'='*60}")
     async with connect() as client:
         sc, cc = find_chars(client)
-        cmd = build_airflow_request(2)
-        print(f"  [{ts()}] Sending 0x18=HIGH: {cmd.hex()}")
-        ds = await send_and_read(client, cc, sc, cmd)
-        if ds:
-            s = parse_status(ds)
-            print(f"  [{ts()}] BLE confirms: mode={s.airflow_mode}, indicator=0x{s.airflow_indicator:02x}")
+        async with StatusStream(client, cc, sc) as stream:
+            cmd = build_airflow_request(2)
+            print(f"  [{ts()}] Sending 0x18=HIGH: {cmd.hex()}")
+            ds = await stream.send(cmd)
+            if ds:
+                s = parse_status(ds)
+                print(f"  [{ts()}] BLE confirms: mode={s.airflow_mode}, indicator=0x{s.airflow_indicator:02x}")
+
+        notifications["phase_a"] = stream.notifications
 
     all_results["phase_a"] = await monitor_power(120, "PHASE_A")
 
@@ -178,8 +232,8 @@ async def main():
     print(f"\n[{ts()}] Resetting to LOW...")
     async with connect() as client:
         sc, cc = find_chars(client)
-        cmd = build_airflow_request(0)
-        await send_and_read(client, cc, sc, cmd)
+        async with StatusStream(client, cc, sc) as stream:
+            await stream.send(build_airflow_request(0))
         print(f"  [{ts()}] Reset to LOW")
     await asyncio.sleep(60)
 
@@ -189,21 +243,23 @@ async def main():
     print(f"{'='*60}")
     async with connect() as client:
         sc, cc = find_chars(client)
-
-        # Send 3 time syncs (like the phone does periodically)
-        for i in range(3):
-            ts_pkt = build_time_sync()
-            print(f"  [{ts()}] Sending time sync #{i+1}: {ts_pkt.hex()}")
-            await client.write_gatt_char(cc, ts_pkt, response=True)
-            await asyncio.sleep(1.0)
-
-        # Now send 0x18=HIGH
-        cmd = build_airflow_request(2)
-        print(f"  [{ts()}] Sending 0x18=HIGH: {cmd.hex()}")
-        ds = await send_and_read(client, cc, sc, cmd)
-        if ds:
-            s = parse_status(ds)
-            print(f"  [{ts()}] BLE confirms: mode={s.airflow_mode}, indicator=0x{s.airflow_indicator:02x}")
+        async with StatusStream(client, cc, sc) as stream:
+            # Send 3 time syncs (like the phone does periodically)
+            for i in range(3):
+                ts_pkt = build_time_sync()
+                print(f"  [{ts()}] Sending time sync #{i+1}: {ts_pkt.hex()}")
+                await client.write_gatt_char(cc, ts_pkt, response=True)
+                await asyncio.sleep(1.0)
+
+            # Now send 0x18=HIGH
+            cmd = build_airflow_request(2)
+            print(f"  [{ts()}] Sending 0x18=HIGH: {cmd.hex()}")
+            ds = await stream.send(cmd)
+            if ds:
+                s = parse_status(ds)
+                print(f"  [{ts()}] BLE confirms: mode={s.airflow_mode}, indicator=0x{s.airflow_indicator:02x}")
+
+        notifications["phase_b"] = stream.notifications
 
     all_results["phase_b"] = await monitor_power(120, "PHASE_B")
 
@@ -211,7 +267,8 @@ async def main():
     print(f"\n[{ts()}] Resetting to LOW...")
     async with connect() as client:
         sc, cc = find_chars(client)
-        await send_and_read(client, cc, sc, build_airflow_request(0))
+        async with StatusStream(client, cc, sc) as stream:
+            await stream.send(build_airflow_request(0))
         print(f"  [{ts()}] Reset to LOW")
     await asyncio.sleep(60)
 
@@ -221,27 +278,29 @@ async def main():
     print(f"{'='*60}")
     async with connect() as client:
         sc, cc = find_chars(client)
-
-        # Send 0x29=0 once, then 0x29=1 x30 (shortened from phone's ~60)
-        cmd_29_0 = build_0x29_request(0)
-        print(f"  [{ts()}] Sending 0x29=0: {cmd_29_0.hex()}")
-        await client.write_gatt_char(cc, cmd_29_0, response=True)
-        await asyncio.sleep(0.5)
-
-        cmd_29_1 = build_0x29_request(1)
-        print(f"  [{ts()}] Sending 0x29=1 x30...")
-        for i in range(30):
-            await client.write_gatt_char(cc, cmd_29_1, response=True)
-            await asyncio.sleep(0.1)
-        print(f"  [{ts()}] 0x29 burst complete")
-
-        # Now send 0x18=HIGH
-        cmd = build_airflow_request(2)
-        print(f"  [{ts()}] Sending 0x18=HIGH: {cmd.hex()}")
-        ds = await send_and_read(client, cc, sc, cmd)
-        if ds:
-            s = parse_status(ds)
-            print(f"  [{ts()}] BLE confirms: mode={s.airflow_mode}, indicator=0x{s.airflow_indicator:02x}")
+        async with StatusStream(client, cc, sc) as stream:
+            # Send 0x29=0 once, then 0x29=1 x30 (shortened from phone's ~60)
+            cmd_29_0 = build_0x29_request(0)
+            print(f"  [{ts()}] Sending 0x29=0: {cmd_29_0.hex()}")
+            await client.write_gatt_char(cc, cmd_29_0, response=True)
+            await asyncio.sleep(0.5)
+
+            cmd_29_1 = build_0x29_request(1)
+            print(f"  [{ts()}] Sending 0x29=1 x30...")
+            for i in range(30):
+                await client.write_gatt_char(cc, cmd_29_1, response=True)
+                await asyncio.sleep(0.1)
+            print(f"  [{ts()}] 0x29 burst complete")
+
+            # Now send 0x18=HIGH
+            cmd = build_airflow_request(2)
+            print(f"  [{ts()}] Sending 0x18=HIGH: {cmd.hex()}")
+            ds = await stream.send(cmd)
+            if ds:
+                s = parse_status(ds)
+                print(f"  [{ts()}] BLE confirms: mode={s.airflow_mode}, indicator=0x{s.airflow_indicator:02x}")
+
+        notifications["phase_c"] = stream.notifications
 
     all_results["phase_c"] = await monitor_power(120, "PHASE_C")
 
@@ -249,7 +308,8 @@ async def main():
     print(f"\n[{ts()}] Final reset to LOW...")
     async with connect() as client:
         sc, cc = find_chars(client)
-        await send_and_read(client, cc, sc, build_airflow_request(0))
+        async with StatusStream(client, cc, sc) as stream:
+            await stream.send(build_airflow_request(0))
 
     # --- SUMMARY ---
     print(f"\n{'='*60}")
@@ -265,15 +325,17 @@ async def main():
             print(f"  {'':12s}  hpump: avg={sum(hp_vals)/len(hp_vals):.1f}W "
                   f"min={min(hp_vals):.1f}W max={max(hp_vals):.1f}W")
 
-    # Save raw data
+    # Save raw data; notifications go to a separate file next to it
     outfile = os.path.join(
         os.path.dirname(__file__), '..', '..', 'data', 'captures',
         f'init_fan_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
     )
     os.makedirs(os.path.dirname(outfile), exist_ok=True)
-    with open(outfile, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    dump_json(outfile, all_results)
+    notify_file = outfile.replace('.json', '_notifications.json')
+    dump_json(notify_file, notifications)
     print(f"\nRaw data: {outfile}")
+    print(f"Notifications: {notify_file}")
 
 
 if __name__ == "__main__":
@@ -16,10 +16,14 @@ Usage as CLI:
     python scripts/sound_monitor.py --vibration
 
 Usage as library:
-    from scripts.sound_monitor import read_vibration, read_sensors, stream_sensors
+    from scripts.sound_monitor import SoundMonitorClient, read_vibration, read_sensors
 
     level = await read_vibration()  # float, e.g. 0.047
-    sensors = await read_sensors()  # dict with all sensor values
+    sensors = await read_sensors()  # SensorReading with all sensor values
+
+    # Repeated sampling over one connection
+    async with SoundMonitorClient() as monitor:
+        reading = await monitor.read_once()
 """
 
 from __future__ import annotations
@@ -27,8 +31,10 @@ from __future__ import annotations
 import argparse
 import asyncio
 import os
+import signal
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 
 from aioesphomeapi import APIClient, SensorState
 from dotenv import load_dotenv
@@ -51,49 +57,103 @@ def _get_config() -> tuple[str, int, str]:
     return host, port, psk
 
 
-async def read_sensors(timeout: float = 10.0) -> SensorReading:
-    """Connect, read all sensor values once, disconnect."""
-    host, port, psk = _get_config()
-    client = APIClient(host, port, password="", noise_psk=psk)
+class SoundMonitorClient:
+    """Long-lived connection to the sound/vibration monitor.
 
-    reading = SensorReading(timestamp=time.time())
-    got_vibration = asyncio.Event()
+    Connects and resolves the sensor entities once, so repeated readings
+    don't pay for a new ESPHome API handshake each time.
+
+    Usage:
+        async with SoundMonitorClient() as monitor:
+            for _ in range(10):
+                reading = await monitor.read_once()
+    """
+
+    def __init__(self) -> None:
+        host, port, psk = _get_config()
+        self._client = APIClient(host, port, password="", noise_psk=psk)
+        self._key_to_name: dict[int, str] = {}
+        self._current = SensorReading(timestamp=time.time())
+        self._waiters: list[asyncio.Future[SensorReading]] = []
+        self._listeners: list[Callable[[SensorReading], None]] = []
+
+    async def __aenter__(self) -> SoundMonitorClient:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Connect, resolve sensor entities, and subscribe to state updates."""
+        await self._client.connect(login=True)
+        try:
+            entities, _services = await self._client.list_entities_services()
+            self._key_to_name = {entity.key: entity.name for entity in entities}
+            self._client.subscribe_states(self._on_state)
+        except BaseException:
+            await self._client.disconnect()
+            raise
+
+    async def close(self) -> None:
+        """Disconnect from the monitor."""
+        await self._client.disconnect()
+
+    def add_listener(self, callback: Callable[[SensorReading], None]) -> None:
+        """Call callback with a SensorReading on every vibration update."""
+        self._listeners.append(callback)
+
+    async def read_once(self, timeout: float = 10.0) -> SensorReading:
+        """Wait for the next vibration update and return all sensor values."""
+        fut: asyncio.Future[SensorReading] = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            reading = await asyncio.wait_for(fut, timeout=timeout)
+        finally:
+            if fut in self._waiters:
+                self._waiters.remove(fut)
+        if reading.sound_rms is None or reading.sound_peak is None:
+            # Give a moment for sound sensors to arrive too
+            await asyncio.sleep(0.5)
+            reading.sound_rms = self._current.sound_rms
+            reading.sound_peak = self._current.sound_peak
+        return reading
+
+    def _on_state(self, state) -> None:
+        if not isinstance(state, SensorState):
+            return
+        name = self._key_to_name.get(state.key, "")
+        current = self._current
+        if name == "Vibration Level":
+            current.vibration = state.state
+            current.timestamp = time.time()
+            waiters, self._waiters = self._waiters, []
+            for fut in waiters:
+                if not fut.done():
+                    fut.set_result(replace(current))
+            for callback in self._listeners:
+                callback(replace(current))
+        elif name == "Sound Level RMS":
+            current.sound_rms = state.state
+        elif name == "Sound Level Peak":
+            current.sound_peak = state.state
 
-    try:
-        await client.connect(login=True)
-        entities, services = await client.list_entities_services()
-
-        # Build key→name map
-        key_to_name: dict[int, str] = {}
-        for entity in entities:
-            if hasattr(entity, "key") and hasattr(entity, "name"):
-                key_to_name[entity.key] = entity.name
-
-        def on_state(state):
-            if not isinstance(state, SensorState):
-                return
-            name = key_to_name.get(state.key, "")
-            if name == "Vibration Level":
-                reading.vibration = state.state
-                reading.timestamp = time.time()
-                got_vibration.set()
-            elif name == "Sound Level RMS":
-                reading.sound_rms = state.state
-            elif name == "Sound Level Peak":
-                reading.sound_peak = state.state
-
-        client.subscribe_states(on_state)
-        await asyncio.wait_for(got_vibration.wait(), timeout=timeout)
-        # Give a moment for sound sensors to arrive too
-        await asyncio.sleep(0.5)
-    finally:
-        await client.disconnect()
 
-    return reading
+async def read_sensors(timeout: float = 10.0) -> SensorReading:
+    """Connect, read all sensor values once, disconnect.
+
+    Convenience wrapper around SoundMonitorClient for one-off readings.
+    """
+    async with SoundMonitorClient() as monitor:
+        return await monitor.read_once(timeout)
 
 
 async def read_vibration(timeout: float = 10.0) -> float:
-    """Read just the vibration level. Returns m/s² (std dev)."""
+    """Read just the vibration level. Returns m/s² (std dev).
+
+    Convenience wrapper that connects for a single reading. When sampling
+    repeatedly, keep a SoundMonitorClient open and call read_once() instead.
+    """
     reading = await read_sensors(timeout)
     if reading.vibration is None:
         raise RuntimeError("No vibration reading received")
@@ -110,67 +170,54 @@ async def stream_sensors(
     callback receives a SensorReading for each update.
     If no callback, prints to stdout.
     """
-    host, port, psk = _get_config()
-    client = APIClient(host, port, password="", noise_psk=psk)
-
-    await client.connect(login=True)
-    entities, services = await client.list_entities_services()
-
-    key_to_name: dict[int, str] = {}
-    for entity in entities:
-        if hasattr(entity, "key") and hasattr(entity, "name"):
-            key_to_name[entity.key] = entity.name
-
-    current = SensorReading(timestamp=time.time())
+    loop = asyncio.get_running_loop()
+    stop: asyncio.Future[None] = loop.create_future()
     readings_count = 0
-    done = asyncio.Event()
 
-    def on_state(state):
-        nonlocal current, readings_count
-        if not isinstance(state, SensorState):
-            return
-        name = key_to_name.get(state.key, "")
-        if name == "Vibration Level":
-            current.vibration = state.state
-            current.timestamp = time.time()
-            readings_count += 1
-            if callback:
-                callback(SensorReading(
-                    vibration=current.vibration,
-                    sound_rms=current.sound_rms,
-                    sound_peak=current.sound_peak,
-                    timestamp=current.timestamp,
-                ))
-            else:
-                parts = []
-                if current.vibration is not None:
-                    parts.append(f"vibration={current.vibration:.4f}")
-                if current.sound_rms is not None:
-                    parts.append(f"rms={current.sound_rms:.1f}dB")
-                if current.sound_peak is not None:
-                    parts.append(f"peak={current.sound_peak:.1f}dB")
-                ts = time.strftime("%H:%M:%S", time.localtime(current.timestamp))
-                print(f"[{ts}] {' | '.join(parts)}")
-            if count > 0 and readings_count >= count:
-                done.set()
-        elif name == "Sound Level RMS":
-            current.sound_rms = state.state
-        elif name == "Sound Level Peak":
-            current.sound_peak = state.state
+    def on_reading(reading: SensorReading) -> None:
+        nonlocal readings_count
+        readings_count += 1
+        if callback:
+            callback(reading)
+        else:
+            parts = []
+            if reading.vibration is not None:
+                parts.append(f"vibration={reading.vibration:.4f}")
+            if reading.sound_rms is not None:
+                parts.append(f"rms={reading.sound_rms:.1f}dB")
+            if reading.sound_peak is not None:
+                parts.append(f"peak={reading.sound_peak:.1f}dB")
+            ts = time.strftime("%H:%M:%S", time.localtime(reading.timestamp))
+            print(f"[{ts}] {' | '.join(parts)}")
+        if count > 0 and readings_count >= count and not stop.done():
+            stop.set_result(None)
+
+    def on_sigint() -> None:
+        if not stop.done():
+            stop.set_result(None)
+
+    # Streaming indefinitely ends on Ctrl+C; resolve the stop future from the
+    # signal so the monitor connection is closed cleanly.
+    sigint_installed = False
+    if count == 0:
+        try:
+            loop.add_signal_handler(signal.SIGINT, on_sigint)
+            sigint_installed = True
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C raises KeyboardInterrupt instead
 
     try:
-        client.subscribe_states(on_state)
-        if count > 0:
+        async with SoundMonitorClient() as monitor:
+            monitor.add_listener(on_reading)
             try:
-                await asyncio.wait_for(done.wait(), timeout=count * interval + 30)
+                await asyncio.wait_for(stop, timeout=count * interval + 30 if count > 0 else None)
             except asyncio.TimeoutError:
                 pass
-        else:
-            await asyncio.Event().wait()  # run forever
     except KeyboardInterrupt:
         pass
     finally:
-        await client.disconnect()
+        if sigint_installed:
+            loop.remove_signal_handler(signal.SIGINT)
 
 
 def main():
@@ -15,10 +15,16 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import sys
+import time
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
+from bleak.exc import BleakError
+
 from .protocol import (
     AIRFLOW_HIGH,
+    AIRFLOW_INDICATOR,
     AIRFLOW_LOW,
     AIRFLOW_MEDIUM,
     COMMAND_CHAR_UUID,
@@ -47,9 +53,39 @@ from .protocol import (
     parse_status,
 )
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _timeout
+else:
+    from async_timeout import timeout as _timeout
+
 if TYPE_CHECKING:
     from bleak import BleakClient
 
+# (status, command) characteristic handles per device address. GATT handles
+# are stable for a device, so reconnects resolve both characteristics with
+# a handle lookup instead of scanning every service.
+_CHARACTERISTIC_HANDLES: dict[str, tuple[int, int]] = {}
+
+# MAGIC as two ints, so notifications are matched without slicing the payload
+_MAGIC_0, _MAGIC_1 = MAGIC
+
+# How long an unconfirmed write keeps the request lock while the device's
+# reply to it is drained
+_UNCONFIRMED_REPLY_TIMEOUT = 2.0
+
+# Requests without parameters, or with a small fixed set of values, are
+# built once at import time.
+_STATUS_REQUEST = build_status_request()
+_SENSOR_REQUEST = build_sensor_request()
+_FULL_DATA_REQUEST = build_full_data_request()
+_SCHEDULE_CONFIG_REQUEST = build_schedule_config_request()
+_MODE_TO_AIRFLOW = {"low": AIRFLOW_LOW, "medium": AIRFLOW_MEDIUM, "high": AIRFLOW_HIGH}
+_AIRFLOW_TO_MODE = {airflow: mode for mode, airflow in _MODE_TO_AIRFLOW.items()}
+_AIRFLOW_TO_INDICATOR = {airflow: indicator for indicator, airflow in AIRFLOW_INDICATOR.items()}
+_MODE_SELECT_REQUESTS = {level: build_mode_select_request(level) for level in AirflowLevel}
+_BOOST_COMMANDS = {enable: build_boost_command(enable) for enable in (True, False)}
+_PREHEAT_REQUESTS = {enabled: build_preheat_request(enabled) for enabled in (True, False)}
+
 
 class VisionAirClient:
     """Client for controlling VisionAir ventilation devices.
@@ -65,6 +101,10 @@ class VisionAirClient:
 
     Args:
         client: Connected BleakClient or compatible (e.g., ESPHomeClient)
+        pipeline_requests: Send the requests of get_fresh_status back to
+            back instead of waiting for each response. Only for direct
+            connections; ESPHome proxies drop notifications when requests
+            overlap.
 
     Example:
         async with BleakClient(device) as client:
@@ -74,124 +114,360 @@ class VisionAirClient:
             await visionair.set_airflow_mode("medium")
     """
 
-    def __init__(self, client: "BleakClient") -> None:
+    def __init__(self, client: "BleakClient", *, pipeline_requests: bool = False) -> None:
         self._client = client
+        self._pipeline_requests = pipeline_requests
         self._last_status: DeviceStatus | None = None
+        # time.monotonic() of the last DEVICE_STATE read from the device
+        self._last_status_at = 0.0
         self._status_char: Any = None
         self._command_char: Any = None
+        self._services: Any = None
+        self._write_without_response = False
+        self._notify_started = False
+        self._waiters: dict[int, list[asyncio.Future[bytes]]] = {}
+        self._in_flight: dict[tuple[bytes, int], asyncio.Task[bytes]] = {}
+        self._in_flight_callers: dict[asyncio.Task[bytes], int] = {}
+        # Responses are matched by packet type only, so requests whose
+        # responses share a type (most are DEVICE_STATE) must not overlap.
+        self._request_lock = asyncio.Lock()
+        self._reply_drain: asyncio.Task[None] | None = None
+
+    async def aclose(self) -> None:
+        """Stop status notifications and fail pending requests.
+
+        Notifications are enabled once, on the first request, and stay
+        enabled for the lifetime of the client. Call this before reusing
+        the BLE connection for something else. Disconnecting also ends the
+        subscription, so this is optional when the connection is closed.
+
+        Requests still waiting for a response raise ConnectionError.
+        """
+        for waiters in self._waiters.values():
+            for fut in waiters:
+                if not fut.done():
+                    fut.set_exception(ConnectionError("Client closed"))
+        self._waiters.clear()
+        if self._notify_started:
+            self._notify_started = False
+            await self._stop_notify()
 
     async def _stop_notify(self) -> None:
         """Stop notifications, ignoring errors if already disconnected.
 
-        The BLE proxy may disconnect while we're waiting for a notification
-        (e.g. on timeout). The stop_notify call in the finally block would
-        then raise BleakError("not connected"), masking the original error.
+        The BLE proxy may disconnect at any time (e.g. after a timeout), in
+        which case stop_notify raises BleakError("not connected").
         """
         try:
             await self._client.stop_notify(self._status_char)
-        except Exception:
+        except (BleakError, OSError):
             pass
 
+    async def _ensure_notify(self) -> None:
+        """Subscribe to status notifications, once per client.
+
+        A single handler receives every notification and routes it to the
+        requests waiting for that packet type. This avoids the CCCD writes
+        of a start_notify/stop_notify pair around every request.
+        """
+        if self._notify_started:
+            return
+        await self._client.start_notify(self._status_char, self._on_notify)
+        self._notify_started = True
+
+    def _on_notify(self, *args: Any) -> None:
+        """Resolve the requests waiting for this notification's packet type.
+
+        Bleak and bleak-esphome both invoke notification callbacks on the
+        event loop thread, so futures are resolved directly rather than via
+        call_soon_threadsafe.
+        """
+        data = args[-1]  # data is always last arg
+        if len(data) < 3 or data[0] != _MAGIC_0 or data[1] != _MAGIC_1:
+            return
+        waiters = self._waiters.pop(data[2], None)
+        if not waiters:
+            return
+        # Bleak hands over bytes on some backends and bytearray on others;
+        # only the mutable one needs a copy.
+        packet = data if type(data) is bytes else bytes(data)
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(packet)
+
+    def _register_waiter(self, packet_type: int) -> asyncio.Future[bytes]:
+        """Return a future resolved with the next packet of the given type.
+
+        Register before writing the command so a fast response can't be missed.
+        """
+        fut: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(packet_type, []).append(fut)
+        return fut
+
+    def _discard_waiter(self, packet_type: int, fut: asyncio.Future[bytes]) -> None:
+        """Unregister a waiter that timed out or was cancelled."""
+        waiters = self._waiters.get(packet_type)
+        if waiters and fut in waiters:
+            waiters.remove(fut)
+            if not waiters:
+                del self._waiters[packet_type]
+
     def _find_characteristics(self) -> None:
         """Find device characteristics from services.
 
         ESPHomeClient requires characteristic objects, not UUID strings.
         BleakClient accepts both, so we use objects for compatibility.
+
+        Resolved once per GATT table. A reconnect of the same client brings
+        a new service collection, whose characteristics replace the old
+        ones and which needs a new notification subscription.
         """
-        if self._status_char is not None:
+        services = self._client.services
+        if self._status_char is not None and services is self._services:
             return
+        self._status_char = self._command_char = None
+        self._notify_started = False
+
+        address = getattr(self._client, "address", None)
+        if address not in _CHARACTERISTIC_HANDLES or not self._resolve_cached_handles(address):
+            chars_by_uuid = {
+                char.uuid: char
+                for svc in services
+                for char in svc.characteristics
+            }
+            self._status_char = chars_by_uuid.get(STATUS_CHAR_UUID)
+            self._command_char = chars_by_uuid.get(COMMAND_CHAR_UUID)
+
+            if not self._status_char or not self._command_char:
+                raise RuntimeError(
+                    f"Device characteristics not found. "
+                    f"Expected {STATUS_CHAR_UUID} and {COMMAND_CHAR_UUID}"
+                )
 
-        for svc in self._client.services:
-            for char in svc.characteristics:
-                if char.uuid == STATUS_CHAR_UUID:
-                    self._status_char = char
-                elif char.uuid == COMMAND_CHAR_UUID:
-                    self._command_char = char
-
-        if not self._status_char or not self._command_char:
-            raise RuntimeError(
-                f"Device characteristics not found. "
-                f"Expected {STATUS_CHAR_UUID} and {COMMAND_CHAR_UUID}"
-            )
-
-    async def get_status(self, timeout: float = 10.0) -> DeviceStatus:
-        """Get current device status.
+            if address is not None:
+                _CHARACTERISTIC_HANDLES[address] = (
+                    self._status_char.handle,
+                    self._command_char.handle,
+                )
 
-        Args:
-            timeout: How long to wait for response in seconds
+        self._write_without_response = "write-without-response" in getattr(
+            self._command_char, "properties", ()
+        )
+        self._services = services
 
-        Returns:
-            DeviceStatus with current device state
+    def _resolve_cached_handles(self, address: str) -> bool:
+        """Resolve characteristics from handles cached on an earlier connection.
 
-        Raises:
-            TimeoutError: If no response within timeout
+        Returns False (leaving the characteristics unset) if the handles no
+        longer point at the expected UUIDs, so the caller falls back to a scan.
         """
-        self._find_characteristics()
+        status_handle, command_handle = _CHARACTERISTIC_HANDLES[address]
+        services = self._client.services
+        status_char = services.get_characteristic(status_handle)
+        command_char = services.get_characteristic(command_handle)
+        if (
+            status_char is None
+            or command_char is None
+            or status_char.uuid != STATUS_CHAR_UUID
+            or command_char.uuid != COMMAND_CHAR_UUID
+        ):
+            return False
+        self._status_char = status_char
+        self._command_char = command_char
+        return True
+
+    async def _send_command(
+        self,
+        packet: bytes,
+        response_type: int,
+        timeout: float,
+        *,
+        reply_confirms: bool = False,
+        coalesce: bool = False,
+    ) -> bytes:
+        """Write a command and return the next notification of response_type.
 
-        status_data: bytes | None = None
-        event = asyncio.Event()
+        Set coalesce for read requests: concurrent identical reads share
+        one write and response, so a burst of polls costs a single BLE
+        round trip. Commands always take their own turn on the request
+        lock, so the last of several setter calls is the one applied.
 
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]  # data is always last arg
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
+        Set reply_confirms for commands whose response notification confirms
+        the change. Their write skips the GATT write response when the
+        characteristic supports writes without one. Read requests leave it
+        unset and always get a write response.
 
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(
-                self._command_char, build_status_request(), response=True
+        Raises:
+            TimeoutError: If no matching notification arrives within timeout
+        """
+        # The timeout covers the wait for the request lock too, so a command
+        # that times out while queued is never written.
+        if not coalesce:
+            async with _timeout(timeout):
+                return await self._write_and_wait(packet, response_type, reply_confirms)
+
+        key = (packet, response_type)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._write_and_wait(packet, response_type, reply_confirms)
             )
-            await asyncio.wait_for(event.wait(), timeout=timeout)
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        callers = self._in_flight_callers
+        callers[task] = callers.get(task, 0) + 1
+        try:
+            # Shielded so one caller giving up doesn't cancel the others'
+            # request; each caller's own timeout is the only deadline.
+            async with _timeout(timeout):
+                return await asyncio.shield(task)
         finally:
-            await self._stop_notify()
+            callers[task] -= 1
+            if not callers[task]:
+                del callers[task]
+                if not task.done():
+                    # Every caller gave up: stop the request, before its
+                    # write if it is still queued on the request lock.
+                    self._request_done(key, task)
+                    task.cancel()
+
+    def _request_done(self, key: tuple[bytes, int], task: asyncio.Task[bytes]) -> None:
+        """Stop sharing a request that finished or was abandoned.
+
+        A finished request's exception is retrieved here, since every
+        caller may have given up on it already.
+        """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.done() and not task.cancelled():
+            task.exception()
 
-        if not status_data:
-            raise TimeoutError("No status response received")
+    async def _write_and_wait(
+        self, packet: bytes, response_type: int, reply_confirms: bool
+    ) -> bytes:
+        """Write a command and wait for the response, without a deadline.
+
+        Callers bound the whole call, lock wait included, with their timeout.
+        """
+        self._find_characteristics()
+
+        async with self._request_lock:
+            await self._ensure_notify()
+            fut = self._register_waiter(response_type)
+            try:
+                response = not (reply_confirms and self._write_without_response)
+                await self._client.write_gatt_char(self._command_char, packet, response=response)
+                return await fut
+            finally:
+                self._discard_waiter(response_type, fut)
+
+    async def _send_state_command(
+        self,
+        packet: bytes,
+        timeout: float,
+        *,
+        reply_confirms: bool = False,
+        coalesce: bool = False,
+    ) -> DeviceStatus:
+        """Write a command answered by DEVICE_STATE and cache the parsed status."""
+        status_data = await self._send_command(
+            packet,
+            PacketType.DEVICE_STATE,
+            timeout,
+            reply_confirms=reply_confirms,
+            coalesce=coalesce,
+        )
 
         status = parse_status(status_data)
         if not status:
             raise ValueError("Invalid status response")
 
         self._last_status = status
+        self._last_status_at = time.monotonic()
         return status
 
-    async def get_sensors(self, timeout: float = 10.0) -> SensorData:
-        """Get live sensor measurements (temperatures, humidity).
+    async def _send_unconfirmed(self, packet: bytes, **changes: Any) -> DeviceStatus:
+        """Write a command without awaiting DEVICE_STATE; patch the cached status.
+
+        The GATT write response is the only confirmation. Callers must have
+        a cached status to apply the changes to.
+        """
+        await self._write_unconfirmed(packet, PacketType.DEVICE_STATE)
+
+        status = replace(self._last_status, **changes)
+        self._last_status = status
+        return status
+
+    async def _write_unconfirmed(self, packet: bytes, reply_type: int) -> None:
+        """Write a command and return once the GATT write is acknowledged.
+
+        The device still replies with reply_type. The request lock stays
+        held in the background until that reply arrives (or
+        _UNCONFIRMED_REPLY_TIMEOUT passes), so the next request doesn't
+        take it as its own response.
+        """
+        self._find_characteristics()
+        await self._request_lock.acquire()
+        try:
+            await self._ensure_notify()
+            fut = self._register_waiter(reply_type)
+            try:
+                await self._client.write_gatt_char(self._command_char, packet, response=True)
+            except BaseException:
+                self._discard_waiter(reply_type, fut)
+                raise
+        except BaseException:
+            self._request_lock.release()
+            raise
+        self._reply_drain = asyncio.ensure_future(self._drain_reply(reply_type, fut))
+
+    async def _drain_reply(self, reply_type: int, fut: asyncio.Future[bytes]) -> None:
+        """Wait for the reply to an unconfirmed write, then release the request lock."""
+        try:
+            await asyncio.wait((fut,), timeout=_UNCONFIRMED_REPLY_TIMEOUT)
+            if fut.done() and not fut.cancelled():
+                fut.exception()  # nobody awaits the reply; ignore aclose() failing it
+        finally:
+            self._discard_waiter(reply_type, fut)
+            self._request_lock.release()
+
+    async def get_status(self, timeout: float = 10.0, *, max_age: float = 0.0) -> DeviceStatus:
+        """Get current device status.
 
         Args:
             timeout: How long to wait for response in seconds
+            max_age: Return the cached status without a BLE request if the
+                device last reported its status less than this many seconds
+                ago. The cached status includes optimistic updates made
+                since then, e.g. by set_airflow(wait_for_confirmation=False)
+                or set_preheat_temperature, which the device has not
+                confirmed.
 
         Returns:
-            SensorData with current temperature and humidity readings
+            DeviceStatus with current device state
 
         Raises:
             TimeoutError: If no response within timeout
         """
-        self._find_characteristics()
+        if self._last_status is not None and time.monotonic() - self._last_status_at < max_age:
+            return self._last_status
+        return await self._send_state_command(_STATUS_REQUEST, timeout, coalesce=True)
 
-        sensor_data: bytes | None = None
-        event = asyncio.Event()
+    async def get_sensors(self, timeout: float = 10.0) -> SensorData:
+        """Get live sensor measurements (temperatures, humidity).
 
-        def handler(*args: Any) -> None:
-            nonlocal sensor_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.PROBE_SENSORS:
-                sensor_data = bytes(data)
-                event.set()
+        Args:
+            timeout: How long to wait for response in seconds
 
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(
-                self._command_char, build_sensor_request(), response=True
-            )
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
+        Returns:
+            SensorData with current temperature and humidity readings
 
-        if not sensor_data:
-            raise TimeoutError("No sensor response received")
+        Raises:
+            TimeoutError: If no response within timeout
+        """
+        sensor_data = await self._send_command(
+            _SENSOR_REQUEST, PacketType.PROBE_SENSORS, timeout, coalesce=True
+        )
 
         sensors = parse_sensors(sensor_data)
         if not sensors:
@@ -229,49 +505,51 @@ class VisionAirClient:
             TimeoutError: If no status responses received at all
         """
         self._find_characteristics()
-        from dataclasses import replace
-
-        probe_data: bytes | None = None
-        status_data: bytes | None = None
-        schedule_data: bytes | None = None
-        new_packet = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal probe_data, status_data, schedule_data
-            data = bytes(args[-1])
-            if bytes(data[:2]) != MAGIC:
-                return
-            if data[2] == PacketType.PROBE_SENSORS:
-                probe_data = data
-            elif data[2] == PacketType.DEVICE_STATE:
-                status_data = data
-            elif data[2] == PacketType.SCHEDULE:
-                schedule_data = data
-            new_packet.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            # Send each request and wait for its response before the next.
-            # Some BLE proxies (e.g. ESPHome) drop notifications if multiple
-            # commands are sent before their responses are consumed.
-            for cmd in [
-                build_full_data_request(),
-                build_status_request(),
-                build_sensor_request(),
-            ]:
-                if not self._client.is_connected:
-                    break
-                new_packet.clear()
-                await self._client.write_gatt_char(
-                    self._command_char, cmd, response=True
-                )
-                try:
-                    await asyncio.wait_for(new_packet.wait(), timeout=timeout)
-                except TimeoutError:
-                    pass
-
-        finally:
-            await self._stop_notify()
+        requests = (
+            (_FULL_DATA_REQUEST, PacketType.SCHEDULE),
+            (_STATUS_REQUEST, PacketType.DEVICE_STATE),
+            (_SENSOR_REQUEST, PacketType.PROBE_SENSORS),
+        )
+        async with self._request_lock:
+            await self._ensure_notify()
+            futures = {
+                packet_type: self._register_waiter(packet_type) for _, packet_type in requests
+            }
+            pending = set(futures.values())
+            try:
+                # Send each request and wait for a response before the next,
+                # unless pipelining. Some BLE proxies (e.g. ESPHome) drop
+                # notifications if multiple commands are sent before their
+                # responses are consumed. FULL_DATA_Q can deliver all three
+                # packets on a direct connection, so requests whose packet
+                # already arrived are skipped.
+                for i, (cmd, packet_type) in enumerate(requests):
+                    if futures[packet_type].done():
+                        continue
+                    if not self._client.is_connected:
+                        break
+                    # The notification wait already paces the requests, so only the
+                    # last write actually sent needs a GATT write response (when
+                    # the characteristic supports writes without one). Later
+                    # requests whose packet already arrived won't be sent.
+                    last = all(futures[later].done() for _, later in requests[i + 1 :])
+                    response = not self._write_without_response or last
+                    await self._client.write_gatt_char(
+                        self._command_char, cmd, response=response
+                    )
+                    if not self._pipeline_requests:
+                        _, pending = await asyncio.wait(
+                            pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                        )
+                if self._pipeline_requests and pending:
+                    await asyncio.wait(pending, timeout=timeout)
+            finally:
+                for packet_type, fut in futures.items():
+                    self._discard_waiter(packet_type, fut)
+
+        schedule_data, status_data, probe_data = (
+            fut.result() if fut.done() else None for fut in futures.values()
+        )
 
         if not status_data:
             raise TimeoutError("No status response received")
@@ -280,25 +558,27 @@ class VisionAirClient:
         if not status:
             raise ValueError("Invalid status response")
 
+        overrides: dict[str, Any] = {}
+
         # Remote temperature and humidity from SCHEDULE packet
         if schedule_data:
             remote_temp, remote_humidity = parse_schedule_data(schedule_data)
-            if remote_temp is not None:
-                status = replace(status, temp_remote=remote_temp)
-            if remote_humidity is not None:
-                status = replace(status, humidity_remote=remote_humidity)
+            overrides["temp_remote"] = remote_temp
+            overrides["humidity_remote"] = remote_humidity
 
         # Probe sensor readings from PROBE_SENSORS packet
         sensors = parse_sensors(probe_data) if probe_data else None
         if sensors:
-            if sensors.temp_probe1 is not None:
-                status = replace(status, temp_probe1=sensors.temp_probe1)
-            if sensors.temp_probe2 is not None:
-                status = replace(status, temp_probe2=sensors.temp_probe2)
-            if sensors.humidity_probe1 is not None:
-                status = replace(status, humidity_probe1=sensors.humidity_probe1)
+            overrides["temp_probe1"] = sensors.temp_probe1
+            overrides["temp_probe2"] = sensors.temp_probe2
+            overrides["humidity_probe1"] = sensors.humidity_probe1
+
+        overrides = {k: v for k, v in overrides.items() if v is not None}
+        if overrides:
+            status = replace(status, **overrides)
 
         self._last_status = status
+        self._last_status_at = time.monotonic()
         return status
 
     async def set_airflow_mode(
@@ -322,17 +602,18 @@ class VisionAirClient:
             ValueError: If mode is invalid
             TimeoutError: If no response received
         """
-        mode = mode.lower()
-        if mode not in ("low", "medium", "high"):
+        airflow = _MODE_TO_AIRFLOW.get(mode.lower())
+        if airflow is None:
             raise ValueError("Mode must be 'low', 'medium', or 'high'")
 
-        airflow = {"low": AIRFLOW_LOW, "medium": AIRFLOW_MEDIUM, "high": AIRFLOW_HIGH}[mode]
         return await self.set_airflow(airflow, timeout=timeout)
 
     async def set_airflow(
         self,
         airflow: int,
         timeout: float = 10.0,
+        *,
+        wait_for_confirmation: bool = True,
     ) -> DeviceStatus:
         """Set airflow level.
 
@@ -342,6 +623,10 @@ class VisionAirClient:
         Args:
             airflow: AirflowLevel.LOW (1), MEDIUM (2), or HIGH (3)
             timeout: How long to wait for response
+            wait_for_confirmation: Wait for the device's DEVICE_STATE
+                response. When False and a status is cached, returns once
+                the GATT write is acknowledged, with the cached status
+                optimistically updated to the new level.
 
         Returns:
             Updated DeviceStatus after change
@@ -350,59 +635,50 @@ class VisionAirClient:
             ValueError: If airflow value is invalid
             TimeoutError: If no response received
         """
-        self._find_characteristics()
+        packet = _MODE_SELECT_REQUESTS.get(airflow)
+        if packet is None:
+            packet = build_mode_select_request(airflow)  # raises ValueError
 
-        packet = build_mode_select_request(airflow)
-
-        status_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
+        current = self._last_status
+        if wait_for_confirmation or current is None:
+            return await self._send_state_command(packet, timeout, reply_confirms=True)
 
-        self._last_status = status
-        return status
+        mode = _AIRFLOW_TO_MODE[airflow]
+        return await self._send_unconfirmed(
+            packet,
+            airflow=getattr(current, f"airflow_{mode}") or 0,
+            airflow_indicator=_AIRFLOW_TO_INDICATOR[airflow],
+            airflow_mode=mode,
+        )
 
     async def set_airflow_low(self) -> DeviceStatus:
         """Set airflow to low level.
 
         The actual m³/h output is calculated as: configured_volume × 0.36 ACH
         """
-        return await self.set_airflow_mode("low")
+        return await self.set_airflow(AIRFLOW_LOW)
 
     async def set_airflow_medium(self) -> DeviceStatus:
         """Set airflow to medium level.
 
         The actual m³/h output is calculated as: configured_volume × 0.45 ACH
         """
-        return await self.set_airflow_mode("medium")
+        return await self.set_airflow(AIRFLOW_MEDIUM)
 
     async def set_airflow_high(self) -> DeviceStatus:
         """Set airflow to high level.
 
         The actual m³/h output is calculated as: configured_volume × 0.55 ACH
         """
-        return await self.set_airflow_mode("high")
+        return await self.set_airflow(AIRFLOW_HIGH)
 
-    async def set_boost(self, enable: bool, timeout: float = 10.0) -> DeviceStatus:
+    async def set_boost(
+        self,
+        enable: bool,
+        timeout: float = 10.0,
+        *,
+        wait_for_confirmation: bool = True,
+    ) -> DeviceStatus:
         """Enable or disable BOOST mode.
 
         BOOST mode runs the fan at maximum for 30 minutes, then auto-deactivates.
@@ -411,40 +687,19 @@ class VisionAirClient:
         Args:
             enable: True to enable BOOST, False to disable
             timeout: How long to wait for response
+            wait_for_confirmation: Wait for the device's DEVICE_STATE
+                response. When False and a status is cached, returns once
+                the GATT write is acknowledged, with the cached status
+                optimistically updated.
 
         Returns:
             Updated DeviceStatus after change
         """
-        self._find_characteristics()
-
-        packet = build_boost_command(enable)
-
-        status_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
+        packet = _BOOST_COMMANDS[bool(enable)]
 
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
-
-        self._last_status = status
-        return status
+        if wait_for_confirmation or self._last_status is None:
+            return await self._send_state_command(packet, timeout, reply_confirms=True)
+        return await self._send_unconfirmed(packet, boost_active=bool(enable))
 
     async def set_holiday(self, days: int, timeout: float = 10.0) -> DeviceStatus:
         """Set holiday mode duration.
@@ -465,36 +720,9 @@ class VisionAirClient:
             ValueError: If days is not in range 0-255
             TimeoutError: If no response within timeout
         """
-        self._find_characteristics()
-
         packet = build_holiday_command(days)
 
-        status_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
-
-        self._last_status = status
-        return status
+        return await self._send_state_command(packet, timeout)
 
     async def clear_holiday(self, timeout: float = 10.0) -> DeviceStatus:
         """Disable holiday mode.
@@ -526,36 +754,9 @@ class VisionAirClient:
         Returns:
             Updated DeviceStatus
         """
-        self._find_characteristics()
-
-        packet = build_preheat_request(enabled)
-
-        status_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
+        packet = _PREHEAT_REQUESTS[bool(enabled)]
 
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
-
-        self._last_status = status
-        return status
+        return await self._send_state_command(packet, timeout, reply_confirms=True)
 
     async def set_preheat_temperature(
         self,
@@ -576,96 +777,81 @@ class VisionAirClient:
         Raises:
             ValueError: If temperature is outside 12-18 range
         """
-        self._find_characteristics()
-
         packet = build_preheat_temp_request(temperature)
 
-        status_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.DEVICE_STATE:
-                status_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not status_data:
-            raise TimeoutError("No status response received")
-
-        status = parse_status(status_data)
-        if not status:
-            raise ValueError("Invalid status response")
+        status = await self._send_state_command(packet, timeout)
 
         # Optimistic update: DEVICE_STATE doesn't immediately reflect the new
         # preheat temperature (byte 56 stays stale), but the command is applied
         # (verified against VMI+ app). Apply the requested value so callers
         # see the correct state.
-        from dataclasses import replace
-
         status = replace(status, preheat_temp=temperature)
         self._last_status = status
         return status
 
-    async def set_summer_limit(self, enabled: bool, timeout: float = 10.0) -> DeviceStatus:
+    async def set_summer_limit(
+        self,
+        enabled: bool,
+        timeout: float = 10.0,
+        *,
+        preheat_temp: int | None = None,
+        airflow: int | None = None,
+    ) -> DeviceStatus:
         """Enable or disable summer limit.
 
+        The SYNC packet also carries the preheat temperature and airflow
+        level. Unless both are given, they are taken from the last status,
+        which is fetched first if none is cached.
+
         Args:
             enabled: Whether to enable summer limit
             timeout: How long to wait for acknowledgment
+            preheat_temp: Preheat temperature to send (°C)
+            airflow: AirflowLevel to send
 
         Returns:
             Updated DeviceStatus
         """
         self._find_characteristics()
 
-        if self._last_status is None:
+        if self._last_status is None and (preheat_temp is None or airflow is None):
             await self.get_status()
 
         current = self._last_status
-        temp = current.preheat_temp if current else 16
-        # Use current airflow level for the SYNC packet
-        airflow = AIRFLOW_MEDIUM
-        if current and current.airflow_mode != "unknown":
-            airflow = {"low": AIRFLOW_LOW, "medium": AIRFLOW_MEDIUM, "high": AIRFLOW_HIGH}[current.airflow_mode]
-
-        packet = build_sync_packet(enabled, temp, airflow)
-
-        status_data: bytes | None = None
-        ack_received = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal status_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC:
-                if data[2] == PacketType.DEVICE_STATE:
-                    status_data = bytes(data)
-                    ack_received.set()
-                elif data[2] == PacketType.ACK:
-                    ack_received.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(self._command_char, packet, response=True)
-            await asyncio.wait_for(ack_received.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
+        if preheat_temp is None:
+            preheat_temp = current.preheat_temp if current else 16
+        if airflow is None:
+            airflow = AIRFLOW_MEDIUM
+            if current:
+                airflow = _MODE_TO_AIRFLOW.get(current.airflow_mode, AIRFLOW_MEDIUM)
+
+        packet = build_sync_packet(enabled, preheat_temp, airflow)
+
+        async with self._request_lock:
+            await self._ensure_notify()
+            status_fut = self._register_waiter(PacketType.DEVICE_STATE)
+            ack_fut = self._register_waiter(PacketType.ACK)
+            try:
+                await self._client.write_gatt_char(self._command_char, packet, response=True)
+                done, _ = await asyncio.wait(
+                    (status_fut, ack_fut), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise TimeoutError("No acknowledgment received")
+            finally:
+                self._discard_waiter(PacketType.DEVICE_STATE, status_fut)
+                self._discard_waiter(PacketType.ACK, ack_fut)
 
+        status_data = status_fut.result() if status_fut.done() else None
         if status_data:
             status = parse_status(status_data)
             if status:
                 self._last_status = status
+                self._last_status_at = time.monotonic()
                 return status
 
-        await asyncio.sleep(0.5)
-        return await self.get_status()
+        # ACK without a state packet: ask for it on the same subscription
+        return await self.get_status(timeout=timeout)
 
     async def get_schedule(self, *, timeout: float = 10.0) -> ScheduleConfig:
         """Read the current schedule configuration from the device.
@@ -682,29 +868,9 @@ class VisionAirClient:
         Raises:
             TimeoutError: If no SCHEDULE_CONFIG response within timeout
         """
-        self._find_characteristics()
-
-        config_data: bytes | None = None
-        event = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            nonlocal config_data
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.SCHEDULE_CONFIG:
-                config_data = bytes(data)
-                event.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(
-                self._command_char, build_schedule_config_request(), response=True
-            )
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
-
-        if not config_data:
-            raise TimeoutError("No schedule config response received")
+        config_data = await self._send_command(
+            _SCHEDULE_CONFIG_REQUEST, PacketType.SCHEDULE_CONFIG, timeout, coalesce=True
+        )
 
         config = parse_schedule_config(config_data)
         if not config:
@@ -717,6 +883,7 @@ class VisionAirClient:
         config: ScheduleConfig,
         *,
         timeout: float = 10.0,
+        confirm: bool = True,
     ) -> None:
         """Write a schedule configuration to the device.
 
@@ -726,30 +893,19 @@ class VisionAirClient:
         Args:
             config: ScheduleConfig with exactly 24 slots
             timeout: How long to wait for acknowledgment in seconds
+            confirm: Wait for the ACK notification. When False, returns as
+                soon as the GATT write is acknowledged, without confirming
+                that the device accepted the schedule.
 
         Raises:
             ValueError: If config is invalid
             TimeoutError: If no acknowledgment received
         """
-        self._find_characteristics()
-
         packet = build_schedule_write(config)
-
-        ack_received = asyncio.Event()
-
-        def handler(*args: Any) -> None:
-            data = args[-1]
-            if bytes(data[:2]) == MAGIC and data[2] == PacketType.ACK:
-                ack_received.set()
-
-        await self._client.start_notify(self._status_char, handler)
-        try:
-            await self._client.write_gatt_char(
-                self._command_char, packet, response=True
-            )
-            await asyncio.wait_for(ack_received.wait(), timeout=timeout)
-        finally:
-            await self._stop_notify()
+        if not confirm:
+            await self._write_unconfirmed(packet, PacketType.ACK)
+            return
+        await self._send_command(packet, PacketType.ACK, timeout, reply_confirms=True)
 
     @property
     def last_status(self) -> DeviceStatus | None:
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Coroutine, TypeVar
 
 from bleak import BleakClient, BleakScanner
 
@@ -26,6 +26,32 @@ from .protocol import is_visionair_device
 if TYPE_CHECKING:
     from bleak_esphome.backend.client import ESPHomeClient
 
+_T = TypeVar("_T")
+
+# How often connect_via_proxy checks the proxy scanner for the device
+_SCAN_POLL_INTERVAL = 0.25
+
+
+def run(main: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine on uvloop if it is installed, else on asyncio.
+
+    A drop-in replacement for ``asyncio.run`` in standalone scripts. uvloop
+    cuts the event loop's per-callback overhead, which is most of the CPU
+    work of dispatching BLE notifications.
+
+    Install with: pip install visionair-ble[fast] (Linux and macOS only)
+
+    Example:
+        from visionair_ble.connect import run
+
+        run(main())
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
 
 @asynccontextmanager
 async def connect_direct(
@@ -78,7 +104,7 @@ async def connect_via_proxy(
         api_key: ESPHome API encryption key (noise_psk)
         device_address: Device MAC address. If None, scans for device.
         proxy_port: ESPHome API port (default: 6053)
-        scan_timeout: Time to wait for device discovery
+        scan_timeout: Maximum time to wait for device discovery
         connect_timeout: BLE connection timeout
 
     Yields:
@@ -111,22 +137,7 @@ async def connect_via_proxy(
         scanner = client_data.scanner
         scanner.async_setup()
 
-        # Wait for device discovery
-        await asyncio.sleep(scan_timeout)
-
-        # Find device
-        devices = scanner.discovered_devices_and_advertisement_data
-        target_device = None
-
-        for addr, (device, _) in devices.items():
-            if device_address:
-                if addr.upper() == device_address.upper():
-                    target_device = device
-                    break
-            elif is_visionair_device(addr, device.name):
-                target_device = device
-                break
-
+        target_device = await _wait_for_proxy_device(scanner, device_address, scan_timeout)
         if not target_device:
             raise ConnectionError(
                 "Device not found. Ensure it's powered on, "
@@ -151,6 +162,43 @@ async def connect_via_proxy(
         await api_client.disconnect()
 
 
+async def _wait_for_proxy_device(
+    scanner: Any,
+    device_address: str | None,
+    scan_timeout: float,
+) -> Any:
+    """Wait until the proxy scanner has seen the device.
+
+    Returns as soon as a matching device is discovered instead of always
+    scanning for the full timeout.
+
+    Args:
+        scanner: Set-up bleak-esphome scanner
+        device_address: Device MAC address. If None, any VisionAir device.
+        scan_timeout: Maximum time to wait for discovery
+
+    Returns:
+        The discovered BLEDevice, or None if none was seen in time
+    """
+    address = device_address.upper() if device_address else None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + scan_timeout
+
+    while True:
+        devices = scanner.discovered_devices_and_advertisement_data
+        for addr, (device, _) in devices.items():
+            if address:
+                if addr.upper() == address:
+                    return device
+            elif is_visionair_device(addr, device.name):
+                return device
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(_SCAN_POLL_INTERVAL, remaining))
+
+
 async def scan_direct(timeout: float = 10.0) -> list[tuple[str, str | None]]:
     """Scan for VisionAir devices using local Bluetooth.
 
@@ -891,6 +891,14 @@ def build_sync_packet(
     return MAGIC + payload + bytes([checksum])
 
 
+# Magic + type byte, so parsers validate the header with one slice compare.
+# A slice compare (unlike startswith) also accepts memoryview input.
+_DEVICE_STATE_HEADER = MAGIC + bytes([PacketType.DEVICE_STATE])
+_PROBE_SENSORS_HEADER = MAGIC + bytes([PacketType.PROBE_SENSORS])
+_SCHEDULE_HEADER = MAGIC + bytes([PacketType.SCHEDULE])
+_SCHEDULE_CONFIG_HEADER = MAGIC + bytes([PacketType.SCHEDULE_CONFIG])
+
+
 def parse_status(data: bytes) -> DeviceStatus | None:
     """Parse device state packet (type 0x01).
 
@@ -900,7 +908,7 @@ def parse_status(data: bytes) -> DeviceStatus | None:
     Returns:
         DeviceStatus object or None if packet is invalid
     """
-    if len(data) < 61 or data[:2] != MAGIC or data[DeviceStateOffset.TYPE] != PacketType.DEVICE_STATE:
+    if len(data) < 61 or data[:3] != _DEVICE_STATE_HEADER:
         return None
 
     airflow_indicator = data[DeviceStateOffset.AIRFLOW_INDICATOR]
@@ -988,7 +996,7 @@ def parse_sensors(data: bytes) -> SensorData | None:
     Returns:
         SensorData object or None if packet is invalid
     """
-    if len(data) < 14 or data[:2] != MAGIC or data[ProbeSensorOffset.TYPE] != PacketType.PROBE_SENSORS:
+    if len(data) < 14 or data[:3] != _PROBE_SENSORS_HEADER:
         return None
 
     return SensorData(
@@ -1011,7 +1019,7 @@ def parse_schedule_data(data: bytes) -> tuple[int | None, int | None]:
     Returns:
         Tuple of (remote_temp, remote_humidity), either may be None if invalid
     """
-    if len(data) < 14 or data[:2] != MAGIC or data[ScheduleDataOffset.TYPE] != PacketType.SCHEDULE:
+    if len(data) < 14 or data[:3] != _SCHEDULE_HEADER:
         return (None, None)
 
     temp = data[ScheduleDataOffset.REMOTE_TEMP]
@@ -1036,7 +1044,7 @@ def parse_schedule_config(data: bytes) -> ScheduleConfig | None:
     Returns:
         ScheduleConfig with 24 slots, or None if packet is invalid
     """
-    if len(data) < 55 or data[:2] != MAGIC or data[2] != PacketType.SCHEDULE_CONFIG:
+    if len(data) < 55 or data[:3] != _SCHEDULE_CONFIG_HEADER:
         return None
 
     # Verify header bytes
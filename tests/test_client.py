@@ -1,12 +1,25 @@
+import asyncio
+
 import pytest
 
 from visionair_ble.client import VisionAirClient
-from visionair_ble.protocol import COMMAND_CHAR_UUID, STATUS_CHAR_UUID, MAGIC, PacketType
+from visionair_ble.protocol import (
+    AIRFLOW_HIGH,
+    AIRFLOW_LOW,
+    COMMAND_CHAR_UUID,
+    MAGIC,
+    STATUS_CHAR_UUID,
+    PacketType,
+    build_full_data_request,
+    build_mode_select_request,
+    build_sensor_request,
+)
 
 
 class _Char:
-    def __init__(self, uuid: str):
+    def __init__(self, uuid: str, handle: int = 0):
         self.uuid = uuid
+        self.handle = handle
 
 
 class _Service:
@@ -20,17 +33,24 @@ class _FakeBleClient:
         self.is_connected = True
         self._responses = responses
         self._handler = None
+        self.start_notify_calls = 0
+        self.writes: list[bytes] = []
+        self.write_responses: list[bool] = []
 
     async def start_notify(self, _char, handler):
+        self.start_notify_calls += 1
         self._handler = handler
 
     async def stop_notify(self, _char):
         self._handler = None
 
     async def write_gatt_char(self, _char, _data, response=True):
+        self.writes.append(bytes(_data))
+        self.write_responses.append(response)
         if self._handler and self._responses:
-            pkt = self._responses.pop(0)
-            self._handler(pkt)
+            pkts = self._responses.pop(0)
+            for pkt in pkts if isinstance(pkts, tuple) else (pkts,):
+                self._handler(pkt)
 
 
 def _packet(packet_type: int) -> bytearray:
@@ -67,3 +87,265 @@ async def test_get_fresh_status_prefers_schedule_remote_humidity() -> None:
 
     assert fresh.temp_remote == 21
     assert fresh.humidity_remote == 52
+
+
+@pytest.mark.asyncio
+async def test_notifications_stay_subscribed_across_requests() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    probes = _packet(PacketType.PROBE_SENSORS)
+
+    fake = _FakeBleClient([bytes(status), bytes(probes), bytes(status)])
+    client = VisionAirClient(fake)
+
+    await client.get_status(timeout=0.2)
+    await client.get_sensors(timeout=0.2)
+    await client.get_status(timeout=0.2)
+
+    assert fake.start_notify_calls == 1
+
+    await client.aclose()
+    assert fake._handler is None
+
+
+@pytest.mark.asyncio
+async def test_get_fresh_status_skips_requests_already_answered() -> None:
+    schedule = _packet(PacketType.SCHEDULE)
+    status = _packet(PacketType.DEVICE_STATE)
+    probes = _packet(PacketType.PROBE_SENSORS)
+
+    # FULL_DATA_Q answered with SCHEDULE and DEVICE_STATE at once
+    fake = _FakeBleClient([(bytes(schedule), bytes(status)), bytes(probes)])
+    client = VisionAirClient(fake)
+
+    await client.get_fresh_status(timeout=0.2)
+
+    assert fake.writes == [build_full_data_request(), build_sensor_request()]
+
+
+@pytest.mark.asyncio
+async def test_get_fresh_status_confirms_last_write_actually_sent() -> None:
+    schedule = _packet(PacketType.SCHEDULE)
+    status = _packet(PacketType.DEVICE_STATE)
+    probes = _packet(PacketType.PROBE_SENSORS)
+
+    # FULL_DATA_Q answered with SCHEDULE and PROBE_SENSORS, so the status
+    # request is the last one sent
+    fake = _FakeBleClient([(bytes(schedule), bytes(probes)), bytes(status)])
+    fake.services[0].characteristics[1].properties = ["write", "write-without-response"]
+    client = VisionAirClient(fake)
+
+    await client.get_fresh_status(timeout=0.2)
+
+    assert fake.write_responses == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_get_fresh_status_pipelined_sends_requests_without_waiting() -> None:
+    schedule = _packet(PacketType.SCHEDULE)
+    schedule[11] = 21  # remote temp
+    status = _packet(PacketType.DEVICE_STATE)
+    probes = _packet(PacketType.PROBE_SENSORS)
+
+    # Nothing arrives until the last request has been written
+    fake = _FakeBleClient([(), (), (bytes(schedule), bytes(status), bytes(probes))])
+    client = VisionAirClient(fake, pipeline_requests=True)
+
+    result = await asyncio.wait_for(client.get_fresh_status(timeout=5.0), timeout=1.0)
+
+    assert len(fake.writes) == 3
+    assert result.temp_remote == 21
+
+
+@pytest.mark.asyncio
+async def test_set_airflow_without_confirmation_updates_cached_status() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    fake = _FakeBleClient([bytes(status), bytes(status)])
+    client = VisionAirClient(fake)
+    await client.get_status()
+
+    result = await client.set_airflow(AIRFLOW_HIGH, wait_for_confirmation=False)
+
+    assert len(fake.writes) == 2
+    assert result.airflow_mode == "high"
+    assert client.last_status is result
+
+
+@pytest.mark.asyncio
+async def test_late_reply_to_unconfirmed_write_is_not_taken_by_next_request() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    stale = _packet(PacketType.DEVICE_STATE)
+    stale[47] = 104  # LOW indicator
+    fresh = _packet(PacketType.DEVICE_STATE)
+    fresh[47] = 38  # HIGH indicator
+    fake = _FakeBleClient([bytes(status), (), ()])
+    client = VisionAirClient(fake)
+    await client.get_status()
+
+    await client.set_airflow(AIRFLOW_HIGH, wait_for_confirmation=False)
+    pending = asyncio.ensure_future(client.get_status())
+    for _ in range(10):  # let get_status get as far as it can
+        await asyncio.sleep(0)
+    fake._handler(bytes(stale))  # the device's reply to set_airflow
+    while len(fake.writes) < 3:
+        await asyncio.sleep(0)
+    fake._handler(bytes(fresh))
+
+    assert (await pending).airflow_mode == "high"
+
+
+@pytest.mark.asyncio
+async def test_only_reply_confirmed_setters_skip_the_write_response() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    fake = _FakeBleClient([bytes(status), bytes(status), bytes(status)])
+    fake.services[0].characteristics[1].properties = ["write", "write-without-response"]
+    client = VisionAirClient(fake)
+
+    await client.get_status()
+    await client.set_boost(True)
+    await client.set_airflow(AIRFLOW_HIGH)
+
+    assert fake.write_responses == [True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_write() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    fake = _FakeBleClient([bytes(status)])
+    client = VisionAirClient(fake)
+
+    first, second = await asyncio.gather(client.get_status(), client.get_status())
+
+    assert first == second
+    assert len(fake.writes) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_setters_are_each_written_in_order() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    fake = _FakeBleClient([bytes(status)] * 3)
+    client = VisionAirClient(fake)
+
+    await asyncio.gather(
+        client.set_airflow(AIRFLOW_LOW),
+        client.set_airflow(AIRFLOW_HIGH),
+        client.set_airflow(AIRFLOW_LOW),
+    )
+
+    assert fake.writes == [
+        build_mode_select_request(AIRFLOW_LOW),
+        build_mode_select_request(AIRFLOW_HIGH),
+        build_mode_select_request(AIRFLOW_LOW),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_keeps_each_callers_timeout() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    status[47] = 38  # HIGH indicator
+    fake = _FakeBleClient([()])  # reply delivered below
+    client = VisionAirClient(fake)
+
+    short = asyncio.ensure_future(client.get_status(timeout=0.05))
+    await asyncio.sleep(0)
+    long = asyncio.ensure_future(client.get_status(timeout=5.0))
+    with pytest.raises(asyncio.TimeoutError):
+        await short
+
+    fake._handler(bytes(status))
+
+    assert (await long).airflow_mode == "high"
+    assert len(fake.writes) == 1
+
+
+@pytest.mark.asyncio
+async def test_command_that_times_out_while_queued_is_not_written() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    fake = _FakeBleClient([()])  # reply delivered below
+    client = VisionAirClient(fake)
+
+    slow = asyncio.ensure_future(client.get_status())
+    while not fake.writes:
+        await asyncio.sleep(0)
+    with pytest.raises(asyncio.TimeoutError):
+        await client.set_airflow(AIRFLOW_HIGH, timeout=0.05)
+
+    fake._handler(bytes(status))
+    await slow
+
+    assert len(fake.writes) == 1
+
+
+@pytest.mark.asyncio
+async def test_aclose_fails_pending_requests_with_connection_error() -> None:
+    fake = _FakeBleClient([])  # device never answers
+    client = VisionAirClient(fake)
+
+    pending = asyncio.ensure_future(client.get_status())
+    while not fake.writes:
+        await asyncio.sleep(0)
+    await client.aclose()
+
+    with pytest.raises(ConnectionError):
+        await pending
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resolves_characteristics_and_resubscribes() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    fake = _FakeBleClient([bytes(status), bytes(status)])
+    client = VisionAirClient(fake)
+    await client.get_status()
+
+    # Reconnecting the same client object rediscovers services
+    fake.services = [_Service([_Char(STATUS_CHAR_UUID), _Char(COMMAND_CHAR_UUID)])]
+    await client.get_status()
+
+    assert client._status_char is fake.services[0].characteristics[0]
+    assert fake.start_notify_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_status_max_age_reuses_recent_status() -> None:
+    status = _packet(PacketType.DEVICE_STATE)
+    fake = _FakeBleClient([bytes(status), bytes(status)])
+    client = VisionAirClient(fake)
+
+    first = await client.get_status()
+    assert await client.get_status(max_age=60.0) is first
+    assert len(fake.writes) == 1
+
+    await client.get_status()
+    assert len(fake.writes) == 2
+
+
+class _HandleOnlyServices:
+    """Service collection that only supports lookup by handle."""
+
+    def __init__(self, chars):
+        self._by_handle = {c.handle: c for c in chars}
+
+    def __iter__(self):
+        raise AssertionError("services should not be scanned")
+
+    def get_characteristic(self, handle):
+        return self._by_handle.get(handle)
+
+
+def test_characteristic_handles_are_reused_across_connections(monkeypatch) -> None:
+    monkeypatch.setattr("visionair_ble.client._CHARACTERISTIC_HANDLES", {})
+    status_char = _Char(STATUS_CHAR_UUID, handle=0x0E)
+    command_char = _Char(COMMAND_CHAR_UUID, handle=0x13)
+
+    first = _FakeBleClient([])
+    first.address = "00:A0:50:00:00:01"
+    first.services = [_Service([status_char, command_char])]
+    VisionAirClient(first)._find_characteristics()
+
+    second = _FakeBleClient([])
+    second.address = first.address
+    second.services = _HandleOnlyServices([status_char, command_char])
+    client = VisionAirClient(second)
+    client._find_characteristics()
+
+    assert client._status_char is status_char
+    assert client._command_char is command_char
@@ -214,6 +214,17 @@ class TestStatusParsing:
         assert status.boost_active is False
         assert status.mode_name == "High"
 
+    def test_parse_status_accepts_memoryview(self):
+        """Bleak callbacks may deliver notification data as a memoryview."""
+        packet = bytearray(70)
+        packet[0:3] = b"\xa5\xb6\x01"  # magic + type
+        packet[47] = 38  # airflow indicator (HIGH = 0x26)
+
+        status = parse_status(memoryview(packet))
+
+        assert status is not None
+        assert status.airflow_mode == "high"
+
     def test_parse_status_airflow_modes(self):
         """Test parsing airflow modes from indicator bytes.
 